@@ -37,14 +37,17 @@ def binomial(n: int) -> list[int]:
     if n == 0:
         return [1]
 
-    row: list[int] = [1] + binomial(n - 1)
-    for k in range(1, n):
-        row[k] += row[k + 1]
+    prev = binomial(n - 1)
+    row: list[int] = [1] * (n + 1)
+    for k in range(1, n // 2 + 1):
+        row[k] = row[n - k] = prev[k - 1] + prev[k]
     return row
 
 
 def invbinomial(n: int) -> list[int]:
-    return [(-1)**(n - k) * binomial(n)[k] for k in range(n + 1)]
+    row = binomial(n).copy()
+    row[1 - n % 2::2] = [-b for b in row[1 - n % 2::2]]
+    return row
 
 
 Binomial = Table(
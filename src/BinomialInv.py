@@ -19,7 +19,9 @@ from Binomial import binomial
 
 @cache
 def binomialinv(n: int) -> list[int]:
-    return [(-1)**(n - k) * binomial(n)[k] for k in range(n + 1)]
+    row = binomial(n).copy()
+    row[1 - n % 2::2] = [-b for b in row[1 - n % 2::2]]
+    return row
 
 
 BinomialInv = Table(
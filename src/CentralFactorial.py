@@ -1,4 +1,6 @@
 from functools import cache
+from itertools import accumulate
+import operator
 from _tabltypes import Table
 
 """CentralFactorial.
@@ -18,10 +20,9 @@ def centralfactorial(n: int) -> list[int]:
     if n == 0:
         return [1]
 
-    row = [1]*(n + 1)
-    for k in range(0, n): 
-        row[k+1] = row[k]*(n*n - k*k)
-    return row
+    n2 = n * n
+    squares = accumulate(range(1, 2 * n - 1, 2), initial=0)
+    return list(accumulate((n2 - k2 for k2 in squares), operator.mul, initial=1))
 
 
 CentralFactorial = Table(
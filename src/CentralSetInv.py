@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """Inverse triangle of the central set factorial numbers.
 
@@ -13,17 +13,23 @@ from _tabltypes import Table
 [7] [0, 518400, 773136, 296296, 44473, 3003, 91, 1]
 """
 
-@cache
+# #@
+
+
+_centralsetinv_rows: list[list[int]] = [[1], [0, 1]]
+_centralsetinv_lock = Lock()
+
+
 def centralsetinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [0, 1]
-
-    row = centralsetinv(n - 1) + [1]
-    for k in range(n - 1, 0, -1):
-        row[k] = (n - 1)**2 * row[k] + row[k - 1]
-    return row
+    rows = _centralsetinv_rows
+    with _centralsetinv_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            m2 = (m - 1)**2
+            prev = rows[-1]
+            row = [0] + [m2 * a + b for a, b in zip(prev[1:], prev)] + [1]
+            rows.append(row)
+    return rows[n]
 
  
 CentralSetInv = Table(
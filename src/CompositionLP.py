@@ -1,5 +1,6 @@
 from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """ Compositions of n with largest part k.
 Example: T(5, 3) = 5 because equals 
@@ -17,21 +18,29 @@ card({3+2, 2+3, 3+1+1, 1+3+1, 1+1+3}).
 [9]  0,  1, 54,  94,  59, 28, 12,  5, 2, 1;
 """
 
+# #@
+
+
+_clp_rows: list[list[int]] = []
+_clp_lock = Lock()
 
-@cache
-def _clp(n: int, k: int) -> int:
-    if k < 0 or k > n:
-        return 0
-    if k == 0 or k == n:
-        return 1 
 
-    return (
-        2 * _clp(n - 1, k)
-        + _clp(n - 1, k - 1)
-        - 2 * _clp(n - 2, k - 1)
-        + _clp(n - k - 1, k - 1)
-        - _clp(n - k - 2, k)
-    )
+def _clp(n: int) -> list[int]:
+    T = _clp_rows
+    with _clp_lock:
+        while len(T) <= n:
+            m = len(T)
+            row = [1] * (m + 1)
+            if m > 1:
+                p1, p2 = T[m - 1], T[m - 2]
+                for j in range(1, m):
+                    row[j] = 2 * (p1[j] - p2[j - 1]) + p1[j - 1]
+                for j in range(1, m // 2 + 1):
+                    row[j] += T[m - j - 1][j - 1]
+                for j in range(1, m // 2):
+                    row[j] -= T[m - j - 2][j]
+            T.append(row)
+    return T[n]
 
 
 @cache
@@ -39,7 +48,7 @@ def compositionlp(n: int) -> list[int]:
     if n == 0:
         return [1]
 
-    return [_clp(n - 1, k - 1) for k in range(n + 1)]
+    return [0] + _clp(n - 1)
 
 
 CompositionLP = Table(
@@ -1,5 +1,7 @@
-from functools import cache
+from itertools import accumulate
+import operator
 from _tabltypes import Table
+from threading import Lock
 
 """
 Inverse of the Delannoy triangle, unsigned version.
@@ -15,17 +17,24 @@ Inverse of the Delannoy triangle, unsigned version.
 [8]  8558, 15310, 10286,  4942, 1838,  526, 110,  15,  1;
 """
 
-@cache
-def delannoyinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
+# #@
+
 
-    d = delannoyinv(n - 1)
-    row = [sum(d)] + d
-    for k in range(n - 1, 0, -1):
-        row[k] = row[k + 1] + d[k - 1] + d[k]
+_delannoyinv_rows: list[list[int]] = [[1]]
+_delannoyinv_lock = Lock()
 
-    return row
+
+def delannoyinv(n: int) -> list[int]:
+    rows = _delannoyinv_rows
+    with _delannoyinv_lock:
+        while len(rows) <= n:
+            # With the suffix sums D[k] = d[k] + ... + d[-1] of the previous
+            # row the recurrence T(n, k) = T(n, k+1) + d[k-1] + d[k] unfolds
+            # to T(n, 0) = D[0] and T(n, k) = D[k-1] + D[k] for k > 0.
+            D = list(accumulate(reversed(rows[-1])))
+            D.reverse()
+            rows.append([D[0]] + list(map(operator.add, D, D[1:] + [0])))
+    return rows[n]
 
 
 DelannoyInv = Table(
@@ -1,5 +1,7 @@
 from functools import cache
+import operator
 from _tabltypes import Table
+from threading import Lock
 
 
 """ Cardinalities of finite distributive lattices.
@@ -13,13 +15,35 @@ from _tabltypes import Table
     [7] 1, 21, 70, 85, 55, 21, 7, 1;
 """
 
-@cache
-def _distlattices(n: int, k: int) -> int:
-    if k == 0 or n == 0: return 1
+# #@
+
+
+_distlattices_cols: list[list[int]] = []
+_distlattices_lock = Lock()
 
-    s = [_distlattices(2 * j, k - 1) * _distlattices(n - 1 - 2 * j, k) 
-            for j in range(1 + (n - 1) // 2)]
-    return sum(s) + _distlattices(n, k - 1)
+
+def _distlattices_fill(N: int) -> list[list[int]]:
+    cols = _distlattices_cols
+    with _distlattices_lock:
+        for k in range(N + 1):
+            if k == len(cols):
+                cols.append([1])
+            col = cols[k]
+            for m in range(len(col), N - k + 1):
+                if k == 0:
+                    col.append(1)
+                    continue
+                prev = cols[k - 1]
+                conv = sum(map(operator.mul, prev[0:m:2], col[m - 1::-2]))
+                col.append(prev[m] + conv)
+    return cols
+
+
+def _distlattices(n: int, k: int) -> int:
+    cols = _distlattices_cols
+    if k >= len(cols) or n >= len(cols[k]):
+        cols = _distlattices_fill(n + k)
+    return cols[k][n]
 
 
 # TODO Give a row based recurrence for this.
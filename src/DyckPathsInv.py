@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """Inverse of the DyckPaths triangle. Unsigned version.
 
@@ -13,22 +13,23 @@ from _tabltypes import Table
 """
 
 
-@cache
-def dyckpathsinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [1, 1]
+# #@
+
 
-    q = dyckpathsinv(n - 2) + [0]
-    p = dyckpathsinv(n - 1) + [0]
-    row = p.copy()
-    row[n] = 1
+_dyckpathsinv_rows: list[list[int]] = [[1], [1, 1]]
+_dyckpathsinv_lock = Lock()
 
-    for k in range(n - 1, 0, -1):
-        row[k] = p[k - 1] + 2 * p[k] - q[k]
 
-    return row
+def dyckpathsinv(n: int) -> list[int]:
+    rows = _dyckpathsinv_rows
+    with _dyckpathsinv_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            q, p = rows[-2], rows[-1]
+            row = [1] + [p[k - 1] + 2 * p[k] - q[k] for k in range(1, m - 1)]
+            row += [p[m - 2] + 2 * p[m - 1], 1]
+            rows.append(row)
+    return rows[n]
 
 
 DyckPathsInv = Table(
@@ -20,16 +20,16 @@ from _tabltypes import Table
 @cache
 def eulerianzigzag(n: int) -> list[int]:
 
-    b = binomial(n + 1)
-    return [sum((-1)**j * b[j] * _distlattices(n, k - j) for j in range(k + 1)) for k in range(n + 1)]
+    b = [-t if j & 1 else t for j, t in enumerate(binomial(n + 1))]
+    return [sum(b[j] * _distlattices(n, k - j) for j in range(k + 1)) for k in range(n + 1)]
 
 
 # Using a different enumeration:
 @cache
 def ezz(n: int) -> list[int]:
     n += 2
-    b = binomial(n + 1)
-    return [sum((-1)**j * b[j] * _distlattices(n, k - j) for j in range(k + 1)) for k in range(n - 1)]
+    b = [-t if j & 1 else t for j, t in enumerate(binomial(n + 1))]
+    return [sum(b[j] * _distlattices(n, k - j) for j in range(k + 1)) for k in range(n - 1)]
 
 
 EulerianZigZag = Table(
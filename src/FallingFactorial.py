@@ -1,4 +1,6 @@
 from functools import cache
+from itertools import accumulate
+import operator
 from _tabltypes import Table
 
 """Falling factorial, number of permutations of n things k at a time.
@@ -18,13 +20,7 @@ from _tabltypes import Table
 
 @cache
 def fallingfactorial(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-
-    r = fallingfactorial(n - 1)
-    row = [n * r[k] for k in range(-1, n)]
-    row[0] = 1
-    return row
+    return list(accumulate(range(n, 0, -1), operator.mul, initial=1))
 
 
 FallingFactorial = Table(
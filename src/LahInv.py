@@ -20,7 +20,9 @@ A signed version of the Lah numbers.
 
 @cache
 def lahinv(n: int) -> list[int]:
-    return [(-1)**(n - k) * lah(n)[k] for k in range(n+1)]
+    row = lah(n).copy()
+    row[1 - n % 2::2] = [-t for t in row[1 - n % 2::2]]
+    return row
 
 
 LahInv = Table(
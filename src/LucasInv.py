@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """To call this triangle 'LucasInv' is a (slight) misnomer. 
 This is an integer version of the matrix inverse of the Lucas
@@ -18,14 +18,20 @@ triangle. T(n, k) = -LucasInv(n, k)*(-2)^(n-k+1).
 """
 
 
-@cache
-def lucasinv(n: int) -> list[int]:
-    if n == 0: return [1]
+# #@
+
+
+_lucasinv_rows: list[list[int]] = [[1]]
+_lucasinv_lock = Lock()
 
-    r = [1] + lucasinv(n - 1) 
-    for k in range(1, n): 
-        r[k] += 2*r[k + 1]
-    return  r
+
+def lucasinv(n: int) -> list[int]:
+    rows = _lucasinv_rows
+    with _lucasinv_lock:
+        while len(rows) <= n:
+            p = rows[-1]
+            rows.append([1] + [a + 2 * b for a, b in zip(p, p[1:])] + [1])
+    return rows[n]
 
 
 LucasInv = Table(
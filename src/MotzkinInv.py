@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """Inverse of the Motzkin triangle.
 
@@ -13,19 +13,23 @@ from _tabltypes import Table
   [7] -1,  3,   9, -15,  -5,  15,  -7,   1;
 """
 
-@cache
+# #@
+
+
+_motzkininv_rows: list[list[int]] = [[1], [-1, 1]]
+_motzkininv_lock = Lock()
+
+
 def motzkininv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [-1, 1]
-
-    r2  = motzkininv(n - 2) + [0]
-    r1  = motzkininv(n - 1) + [0]
-    r   = motzkininv(n - 1) + [1]
-    for k in range(0, n):
-        r[k] = r1[k - 1] - r2[k] - r1[k]
-    return r
+    rows = _motzkininv_rows
+    with _motzkininv_lock:
+        while len(rows) <= n:
+            q, p = rows[-2], rows[-1]
+            row = [-q[0] - p[0]]
+            row += [a - c - b for a, b, c in zip(p, p[1:], q[1:])]
+            row += [p[-2] - p[-1], 1]
+            rows.append(row)
+    return rows[n]
 
 
 MotzkinInv = Table(
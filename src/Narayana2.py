@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """
 [0] [1]
@@ -14,17 +14,25 @@ from _tabltypes import Table
 [9] [0, 1, 29, 224, 686, 980, 686, 224, 29, 1]
 """
 
-@cache
-def narayana2(n: int) -> list[int]:
+# #@
+
 
-    if n < 3: return ([1], [0, 1], [0, 1, 1])[n]
+_narayana2_rows: list[list[int]] = [[1], [0, 1], [0, 1, 1]]
+_narayana2_lock = Lock()
 
-    a = narayana2(n - 2) + [0, 0]
-    b = narayana2(n - 1) + [1]
-    for k in range(n - 1, 1, -1):
-        b[k] = (((b[k] + b[k - 1]) * (2 * n - 3)
-               - (a[k] - 2 * a[k - 1] + a[k - 2]) * (n - 3)) // n)
-    return b
+
+def narayana2(n: int) -> list[int]:
+    rows = _narayana2_rows
+    with _narayana2_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            a = rows[-2] + [0, 0]
+            b = rows[-1]
+            s, t = 2 * m - 3, m - 3
+            rows.append(b[:2] + [
+                ((b[k] + b[k - 1]) * s - (a[k] - 2 * a[k - 1] + a[k - 2]) * t) // m
+                for k in range(2, m)] + [1])
+    return rows[n]
 
 
 Narayana2 = Table(
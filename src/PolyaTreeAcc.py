@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """Polya Trees accumulated
 [0] [1]
@@ -16,51 +16,76 @@ from _tabltypes import Table
 """
 
 
-@cache
-def divisors(n: int) -> list[int]:
-    return [d for d in range(n, 0, -1) if n % d == 0]
+# #@
 
 
-@cache
-def _h(n: int, k: int) -> int:
-    return sum(d * _T(d, k) for d in divisors(n))
+# _TC[k][n] = T(n, k) and _HC[k][n] = h(n, k) for n >= 1, where
+#   T(1, k) = [k > 0],
+#   T(n, k) = sum_{i=1..n-1} T(i, k) h(n - i, k - 1) / (n - 1),
+#   h(n, k) = sum_{d | n} d T(d, k).
+# Column k depends only on itself and on column k - 1 of h, so the
+# columns are filled bottom-up in order of increasing k. A tree with n
+# nodes has at most n levels, so T(n, k) = T(n, n) for k >= n and only
+# the entries with n >= k need the convolution.
+_TC: list[list[int]] = []
+_HC: list[list[int]] = []
 
 
 # A244925  (which is (1, 0)-based)
-#@cache
-#def _H(n: int, k: int) -> int:
-#    return sum(d * _T(d, k) for d in divisors(n) if k <= d)
+#   H(n, k) = sum_{d | n, k <= d} d T(d, k)
 
 
 # A113704
-#@cache
-#def _e(n: int, k: int) -> int:
-#    return sum(d * T(d, k) for d in divisors(n) if k == d)
-
-
-# Call the function _h, _H, or _e according to your use case.
-@cache
-def _T(n: int, k: int) -> int:
-    if n == 1:
-        return int(k > 0)
-
-    return sum(_T(i, k) * _h(n - i, k - 1)
-               for i in range(1, n)
-            ) // (n - 1)
-
-
-# _T(n, k) will add a (0,0,0...) column on the left.
+#   e(n, k) = sum_{d | n, k == d} d T(d, k)
+
+
+# Use h, H, or e in the fill of _HC according to your use case.
+def _polyatreefill(N: int) -> None:
+    while len(_TC) <= N:
+        _TC.append([0])
+        _HC.append([0])
+    zeros = [0] * (N + 1)
+    for k in range(N + 1):
+        t, h = _TC[k], _HC[k]
+        hp = _HC[k - 1] if k > 0 else zeros
+        lo = len(t)
+        for n in range(lo, N + 1):
+            if n == 1:
+                t.append(int(k > 0))
+            elif n < k:
+                t.append(_TC[n][n])
+            else:
+                t.append(sum(t[i] * hp[n - i] for i in range(1, n)) // (n - 1))
+        # h(m, k) receives d T(d, k) from each divisor d of the new m >= lo.
+        h.extend([0] * (N + 1 - lo))
+        for d in range(1, N + 1):
+            dt = d * t[d]
+            for m in range(max(d, -(-lo // d) * d), N + 1, d):
+                h[m] += dt
+
+
+# T(n, k) will add a (0,0,0...) column on the left.
 # Interpretations exist for both cases, it is mainly
-# a matter of terminology. The form _T(n + 1, k + 1) is
+# a matter of terminology. The form T(n + 1, k + 1) is
 # to be prefered as it covers A113704 in the case k = d,
 # which is our Divisibility triangle.
-@cache
+_polyatreeacc_rows: list[list[int]] = []
+_polyatreeacc_lock = Lock()
+
+
 def polyatreeacc(n: int) -> list[int]:
     if n > 200:
         # raise ValueError("n is too large for this function.")
         print(f"ValueError: n = {n} is too large for function polyatreeacc.")
         return []
-    return [_T(n + 1, k + 1) for k in range(n + 1)]
+    rows = _polyatreeacc_rows
+    with _polyatreeacc_lock:
+        if len(rows) <= n:
+            _polyatreefill(n + 1)
+        while len(rows) <= n:
+            m = len(rows)
+            rows.append([_TC[k + 1][m + 1] for k in range(m + 1)])
+    return rows[n]
 
 
 PolyaTreeAcc = Table(
@@ -80,8 +105,9 @@ if __name__ == "__main__":
 
     # EXPERIMENTAL
 
+    _polyatreefill(8)
     for n in range(9):  # A375546
-        print([_h(n, k) for k in range(n + 1)])
+        print([_HC[k][n] for k in range(n + 1)])
 
     #for n in range(9):  # A375467
     #    print([_H(n, k) for k in range(n + 1)])
@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """Powers.
 
@@ -16,13 +16,21 @@ from _tabltypes import Table
 
 """
 
-@cache
-def powers(n: int) -> list[int]:
-    if n == 0:
-        return [1]
+# #@
+
+
+_powers_rows: list[list[int]] = [[1]]
+_powers_lock = Lock()
 
-    lrow = powers(n - 1)
-    return [k * lrow[k] for k in range(n)] + [1]
+
+def powers(n: int) -> list[int]:
+    rows = _powers_rows
+    with _powers_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            prev = rows[-1]
+            rows.append([k * prev[k] for k in range(m)] + [1])
+    return rows[n]
 
 
 Powers = Table(
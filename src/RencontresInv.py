@@ -1,6 +1,6 @@
-from functools import cache
 from _tabltypes import Table
 from Binomial import binomial
+from threading import Lock
 
 """Inverse of the rencontres triangle. Unsigned version.
 
@@ -17,12 +17,21 @@ from Binomial import binomial
 """
 
 
-@cache
-def rencontresinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
+# #@
+
+
+_rencontresinv_rows: list[list[int]] = [[1]]
+_rencontresinv_lock = Lock()
 
-    return [(n - k - 1)*binomial(n)[k] for k in range(n)] + [1]
+
+def rencontresinv(n: int) -> list[int]:
+    rows = _rencontresinv_rows
+    with _rencontresinv_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            b = binomial(m)
+            rows.append([(m - k - 1) * b[k] for k in range(m)] + [1])
+    return rows[n]
 
 
 RencontresInv = Table(
@@ -1,4 +1,6 @@
 from functools import cache
+from itertools import accumulate
+import operator
 from _tabltypes import Table
 
 """Rising factorial.
@@ -16,14 +18,7 @@ from _tabltypes import Table
 
 @cache
 def risingfactorial(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-
-    row = [1 for _ in range(n + 1)]
-    row[1] = n
-    for k in range(1, n):
-        row[k + 1] = row[k] * (n + k)
-    return row
+    return list(accumulate(range(n, 2 * n), operator.mul, initial=1))
 
 
 RisingFactorial = Table(
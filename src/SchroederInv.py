@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """SchroederInv triangle.
 
@@ -15,19 +15,20 @@ from _tabltypes import Table
 """
 
 
-@cache
-def schroederinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [0, 1]
+# #@
+
 
-    arow = schroederinv(n - 2) + [1]
-    row = schroederinv(n - 1) + [1]
-    for k in range(n - 1, 0, -1):
-        row[k] += row[k - 1] + arow[k - 1]
+_schroederinv_rows: list[list[int]] = [[1], [0, 1]]
+_schroederinv_lock = Lock()
 
-    return row
+
+def schroederinv(n: int) -> list[int]:
+    rows = _schroederinv_rows
+    with _schroederinv_lock:
+        while len(rows) <= n:
+            q, p = rows[-2], rows[-1]
+            rows.append(p[:1] + [a + b + c for a, b, c in zip(p[1:], p, q)] + [1])
+    return rows[n]
 
 
 SchroederInv = Table(
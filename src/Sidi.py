@@ -1,6 +1,6 @@
-from functools import cache
-from Binomial import Binomial
+from Binomial import binomial
 from _tabltypes import Table
+from threading import Lock
 
 """Sidi
 
@@ -15,13 +15,22 @@ from _tabltypes import Table
 
 """
 
-@cache
-def sidi(n: int) -> list[int]:
-    if n == 0:
-        return [1]
+# #@
+
+
+_sidi_rows: list[list[int]] = [[1]]
+_sidi_lock = Lock()
 
-    row = [(-1)**(n-k)*Binomial(n, k)*k**n for k in range(n+1)]
-    return row
+
+def sidi(n: int) -> list[int]:
+    rows = _sidi_rows
+    with _sidi_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            row = [t * k**m for k, t in enumerate(binomial(m))]
+            row[1 - m % 2::2] = [-t for t in row[1 - m % 2::2]]
+            rows.append(row)
+    return rows[n]
 
 
 Sidi = Table(
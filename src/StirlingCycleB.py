@@ -1,5 +1,5 @@
-from functools import cache
 from _tabltypes import Table
+from threading import Lock
 
 """Stirling cycle B-type.
 
@@ -14,19 +14,21 @@ from _tabltypes import Table
 """
 
 
-@cache
-def stirlingcycleb(n: int) -> list[int]:
-    if n == 0:
-        return [1]
+# #@
+
 
-    row = stirlingcycleb(n - 1) + [1]
+_stirlingcycleb_rows: list[list[int]] = [[1]]
+_stirlingcycleb_lock = Lock()
 
-    m = 2 * n - 1
-    for k in range(n - 1, 0, -1):
-        row[k] = m * row[k] + row[k - 1]
-    row[0] *= m
 
-    return row
+def stirlingcycleb(n: int) -> list[int]:
+    rows = _stirlingcycleb_rows
+    with _stirlingcycleb_lock:
+        while len(rows) <= n:
+            m = 2 * len(rows) - 1
+            prev = rows[-1]
+            rows.append([m * prev[0]] + [m * a + b for a, b in zip(prev[1:], prev)] + [1])
+    return rows[n]
 
 
 StirlingCycleB = Table(
@@ -1,7 +1,9 @@
 from functools import cache
 from itertools import accumulate, islice
-from more_itertools import difference, flatten
-from functools import reduce
+from more_itertools import flatten
+from functools import reduce, partial
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from math import factorial, sqrt, lcm, gcd
 from fractions import Fraction
 import operator
@@ -10,8 +12,9 @@ import time
 from pathlib import Path
 import requests
 import json
+import shelve
+from hashlib import blake2b
 from ipywidgets import Dropdown
-from requests import get
 import sys
 from sys import setrecursionlimit, set_int_max_str_digits
 from typing import Callable, TypeAlias, Iterator, Dict, Tuple, NamedTuple
@@ -252,7 +255,9 @@ class Table:
             >>> Abel.alt(4)
             [0, -64, 48, -12, 1]
         """
-        return [(-1) ** k * term for k, term in enumerate(self.row(n))]
+        row = self.row(n).copy()
+        row[1::2] = [-term for term in row[1::2]]
+        return row
 
     def acc(self, n: int) -> trow:
         """
@@ -280,7 +285,8 @@ class Table:
             >>> list(accumulate(Abel.diff(5))) == Abel.row(5)
             True
         """
-        return list(difference(self.row(n)))
+        row = self.row(n)
+        return row[:1] + list(map(operator.sub, row[1:], row))
 
     def der(self, n: int) -> trow:
         """
@@ -523,7 +529,7 @@ class Table:
             [0, 1, 2, -6, 36, -320]
         """
         return [
-            sum((-1) ** (n - k) * self.row(n)[k] * s(k) for k in range(n + 1))
+            sum((-t if (n - k) & 1 else t) * s(k) for k, t in enumerate(self.row(n)))
             for n in range(size)
         ]
 
@@ -824,57 +830,63 @@ def lcsubstr(s: str, t: str) -> tuple[int, int]:
     return (x_longest - longest, longest)
 
 
-def QueryOEIS(
-    seqlist: list[int], maxnum: int = 1, info: bool = False, minlen: int = 24
-) -> int:
-    """
-    Query if a given sequence is present in the OEIS. At least 24 terms
-    of the sequence must be given. The first three terms and signs are disregard.
-    Sequences with huge terms might have to few terms to give reliable results.
-    This is a heuristic function, understand it's limited reach.
-    Args:
-        seqlist: The sequence to search. Must have at least 24 terms.
-        maxnum: max number of sequences to be returned. Defaults to 1.
-        info: Prints details, otherwise is quiet except for warnings. Defaults to False.
+# QueryOEIS may run in several threads (see AnumberDict); the lock
+# keeps the requests at least half a second apart.
+_querylock = Lock()
+_lastquery = 0.0
 
-        minlen: At least {minlen} terms are required.
-    Returns:
-        Returns anum is the A-number of the sequence,
-        Returns 0 if the sequence was not found.
-        If sl < 5 and dl > 12, then anum probably matches the sequence,
-        modulo a couple of first terms and the signs.
-    Raises:
-        Exception: If the OEIS server cannot be reached after multiple attempts.
-        Currently, the function will return -999999 if the OEIS server cannot be reached.
+# All queries share one session, so the connection to oeis.org is
+# kept open between requests. Its pool holds up to 10 connections,
+# enough for the threads of AnumberDict.
+_session = requests.Session()
+
+
+def _Pace() -> None:
+    """Wait until half a second has passed since the previous request."""
+    global _lastquery
+    with _querylock:
+        wait = _lastquery + 0.5 - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _lastquery = time.monotonic()
+
+
+def SearchOEIS(
+    seqlist: list[int], maxnum: int = 1, info: bool = False, minlen: int = 24,
+    say: Callable[..., None] = print,
+) -> tuple[int, bool]:
+    """The search behind QueryOEIS. Also returns whether the match is
+    reliable, i.e. at least 12 terms match and no warning was printed.
+    All output goes through say, which is print by default.
     """
     if len(seqlist) < minlen:
-        print(f"Sequence is too short! We require at least {minlen} terms.")
-        print("You provided:", seqlist)
-        return 0
+        say(f"Sequence is too short! We require at least {minlen} terms.")
+        say("You provided:", seqlist)
+        return 0, False
     if 0 == sum(seqlist[0:36]):
-        return 4  # XXXXX dont search for the all zeros sequence
+        return 4, True  # XXXXX dont search for the all zeros sequence
     off = (
         0 if 0 == sum(seqlist[3:36]) else 3
     )  # XXXXX dont skip leading terms if the rest is zero
     seqstr = SeqToString(seqlist, 160, 36, ",", off, True)
     url = f"https://oeis.org/search?q={seqstr}&fmt=json"
     for _ in range(4):
-        time.sleep(0.5)  # give the OEIS server some time to relax
+        _Pace()  # give the OEIS server some time to relax
         # if debug: print(f"connecting: [{repeat}]")
         try:
-            # jdata: None | list[dict[str, int | str | list[str] ]] = get(url, timeout=30).json()
-            jdata = get(url, timeout=30).json()
+            # jdata: None | list[dict[str, int | str | list[str] ]] = _session.get(url, timeout=30).json()
+            jdata = _session.get(url, timeout=30).json()
             if jdata == None:
                 if 0 == sum(seqlist[::2]) or 0 == sum(seqlist[1::2]):
                     seqlist = [k for k in seqlist if k != 0]
                     seqstr = SeqToString(seqlist, 160, 36, ",", 3, True)
                     if info:
-                        print("Searching without zeros:", seqstr)
+                        say("Searching without zeros:", seqstr)
                     url = f"https://oeis.org/search?q={seqstr}&fmt=json"
                     raise ValueError("Try again")
                 if info:
-                    print("Sorry, no match found for:", seqstr)
-                return 0
+                    say("Sorry, no match found for:", seqstr)
+                return 0, False
             number = dl = ol = 0
             for j in range(min(maxnum, len(jdata))):
                 seq = jdata[j]
@@ -888,24 +900,50 @@ def QueryOEIS(
                 sl = data.count(",", 0, start)  # type: ignore
                 dl = data.count(",", start, start + length)  # type: ignore
                 if dl < 12:
-                    print(f"\n*** WARNING! Only {dl} out of {ol} terms match! ***\n")
+                    say(f"\n*** WARNING! Only {dl} out of {ol} terms match! ***\n")
                 if info or dl < 12:
-                    print("You searched:", seqstr)
-                    print("OEIS-data is:", data)  # type: ignore
+                    say("You searched:", seqstr)
+                    say("OEIS-data is:", data)  # type: ignore
                     # print(f"Info: Starting at index {sl} the next {dl}
                     # consecutive terms match.\nThe matched substring starts
                     # at byte {start} and has length {length}.")
-                    print("*** Found:", anumber, name)
+                    say("*** Found:", anumber, name)
                 if dl > 12:
                     break
-            return int(number)
+            return int(number), dl >= 12
         except ValueError:
             continue
         except requests.exceptions.RequestException as e:
-            print(f"Error: {e}")
+            say(f"Error: {e}")
     # raise Exception(f"Could not open {url}.")
-    print(f"Exception! Could not open {url}.")
-    return -999999
+    say(f"Exception! Could not open {url}.")
+    return -999999, False
+
+
+def QueryOEIS(
+    seqlist: list[int], maxnum: int = 1, info: bool = False, minlen: int = 24
+) -> int:
+    """
+    Query if a given sequence is present in the OEIS. At least 24 terms
+    of the sequence must be given. The first three terms and signs are disregard.
+    Sequences with huge terms might have to few terms to give reliable results.
+    This is a heuristic function, understand it's limited reach.
+    Args:
+        seqlist: The sequence to search. Must have at least 24 terms.
+        maxnum: max number of sequences to be returned. Defaults to 1.
+        info: Prints details, otherwise is quiet except for warnings. Defaults to False.
+
+        minlen: At least {minlen} terms are required.
+    Returns:
+        Returns anum is the A-number of the sequence,
+        Returns 0 if the sequence was not found.
+        If sl < 5 and dl > 12, then anum probably matches the sequence,
+        modulo a couple of first terms and the signs.
+    Raises:
+        Exception: If the OEIS server cannot be reached after multiple attempts.
+        Currently, the function will return -999999 if the OEIS server cannot be reached.
+    """
+    return SearchOEIS(seqlist, maxnum, info, minlen)[0]
 
 
 def LookUp(t: Table, tr: Trait, info: bool = True) -> int:
@@ -2409,6 +2447,7 @@ def TableTraits(T: Table) -> None:
 GlobalDict: Dict[str, Dict[str, int]] = {}
 
 
+@cache
 def GetRoot(name: str = "") -> Path:
     path = Path(__file__).parent.parent
     return (path / name).resolve()
@@ -2423,17 +2462,33 @@ def ShowGlobalDict() -> None:
             print(f"    {trait} -> {dict[trait]}")
 
 
+# The mtime of data/AllTraits.json together with the dictionary loaded from it.
+# ReadJsonDict hands out copies, so changes to GlobalDict do not reach it.
+_jsoncache: tuple[int, Dict[str, Dict[str, int]]] | None = None
+
+
+def InvalidateJsonDict() -> None:
+    """Forget the cached AllTraits.json; the next ReadJsonDict() parses the file again."""
+    global _jsoncache
+    _jsoncache = None
+
+
 def ReadJsonDict() -> Dict[str, Dict[str, int]]:
     """Loaded the file data/AllTraits.json into the global dictionary GlobalDict.
     In case of a FileNotFoundError a new empty dictionary is created.
+    The file is parsed again only if it was modified since the last call.
+    Unsaved changes to GlobalDict are dropped, as with a fresh parse.
     Returns:
         Dict[str, Dict[str, int]]: A global dictionary containing traits dictionaries.
     """
-    global GlobalDict
+    global GlobalDict, _jsoncache
     jsonpath = GetRoot(f"data/AllTraits.json")
     try:
-        with open(jsonpath, "r") as file:
-            GlobalDict = json.load(file)
+        mtime = jsonpath.stat().st_mtime_ns
+        if _jsoncache is None or _jsoncache[0] != mtime:
+            with open(jsonpath, "r") as file:
+                _jsoncache = (mtime, json.load(file))
+        GlobalDict = {tabl: dict(traits) for tabl, traits in _jsoncache[1].items()}
     except FileNotFoundError:
         print("No file 'AllTraits.json' found.")
         GlobalDict = {}
@@ -2443,6 +2498,21 @@ def ReadJsonDict() -> Dict[str, Dict[str, int]]:
     return GlobalDict
 
 
+def WriteJsonDict() -> None:
+    """Save the global dictionary GlobalDict to data/AllTraits.json.
+    Nothing is written if the file already holds these data. Otherwise
+    the data goes to a temporary file that then replaces AllTraits.json,
+    so an interrupted write leaves the old file intact.
+    """
+    jsonpath = GetRoot(f"data/AllTraits.json")
+    if jsonpath.is_file() and json.loads(jsonpath.read_text()) == GlobalDict:
+        return
+    tmppath = jsonpath.with_suffix(".json.tmp")
+    tmppath.write_text(json.dumps(GlobalDict))
+    tmppath.replace(jsonpath)
+    InvalidateJsonDict()
+
+
 def FilterDict(olddict: Dict[str, int]) -> Dict[str, int]:
     """Make a new dictionary with unique A-numbers.
     Args:
@@ -2450,40 +2520,37 @@ def FilterDict(olddict: Dict[str, int]) -> Dict[str, int]:
     Returns:
         Dict[str, int]: A-numbers can appear at most once.
     """
-    anumlist: set[int] = set()
-    newdict: Dict[str, int] = {}
+    # the first trait with a given A-number keeps it.
+    first: Dict[int, str] = {}
     for k, v in olddict.items():
-        if not v in anumlist:
-            newdict[k] = v
-        anumlist.add(v)
-    return newdict
+        first.setdefault(v, k)
+    return {k: v for v, k in first.items()}
 
 
 def TruncateInfo(srcpath: Path) -> None:
     """
-    The function reads the file line by line and writes back the content
-    up to (but not including) the line that starts with the OEIS marker
-    (''' OEIS). Once the marker is found, the file is truncated at that point.
+    The function reads the file line by line up to the line that starts
+    with the OEIS marker (''' OEIS) and truncates the file at the start of
+    this line. The content before the marker is not rewritten.
     Args:
         srcpath (Path): The path to the file to be truncated.
     """
-    oeis_marker = "''' OEIS"
-    with open(srcpath, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-    with open(srcpath, "w", encoding="utf-8") as f:
-        for line in lines:
+    oeis_marker = b"''' OEIS"
+    offset = 0
+    with open(srcpath, "r+b") as f:
+        for line in f:
             if line.startswith(oeis_marker):
-                f.truncate(f.tell())
+                f.truncate(offset)
                 break
-            f.write(line)
+            offset += len(line)
 
 
-def AddAnumsToSrcfile(name: str, dict: Dict[str, int] = {}) -> None:
+def AddAnumsToSrcfile(name: str, dict: Dict[str, int] | None = None) -> None:
     """Add an OEIS section to the source file of a table.
     Args:
         name (str): name of the table
         dict (Dict[str, int], optional): where the OEIS infos are.
-        Defaults to {} which in turn triggers the use of the gloabl dictionary.
+        Defaults to None which in turn triggers the use of the gloabl dictionary.
     Example:
        AddAnumsToSrcfile("Catalan") will add the following line to src/Catalan.py
        indicatting the OEIS A-number of the row sums of the Catalan triangle.
@@ -2491,26 +2558,61 @@ def AddAnumsToSrcfile(name: str, dict: Dict[str, int] = {}) -> None:
     """
 
     global GlobalDict
-    if dict == {}:
+    if not dict:
         ReadJsonDict()
         dict = GlobalDict[name]
     srcpath = GetRoot(f"src/{name}.py")
     TruncateInfo(srcpath)
+    anums = dict.values()
+    lines: list[str] = ["\n\n" + r"'''" + " OEIS\n"]
+    for fullname, anum in sorted(dict.items(), key=itemgetter(1)):
+        if anum != 0:
+            lines.append(f"    {fullname} -> https://oeis.org/A{anum}\n")
+        else:
+            lines.append(f"    {fullname} -> 0 \n")
+    misses = len([v for v in anums if v == 0])
+    hits = len(anums) - misses
+    distincts = len(set(anums))
+    lines.append(
+        f"\n    {name}: Distinct: {distincts}, Hits: {hits}, Misses: {misses}"
+    )
+    lines.append("\n" + r"'''" + "\n")
     with open(srcpath, "a+", encoding="utf-8") as dest:
-        d = {k: v for k, v in sorted(dict.items(), key=lambda item: item[1])}
-        dest.write("\n\n" + r"'''" + " OEIS\n")
-        for fullname, anum in d.items():
-            if anum != 0:
-                dest.write(f"    {fullname} -> https://oeis.org/A{anum}\n")
-            else:
-                dest.write(f"    {fullname} -> 0 \n")
-        misses = len([v for v in d.values() if v == 0])
-        hits = len(d.values()) - misses
-        distincts = len(set(d.values()))
-        dest.write(
-            f"\n    {name}: Distinct: {distincts}, Hits: {hits}, Misses: {misses}"
-        )
-        dest.write("\n" + r"'''" + "\n")
+        dest.write("".join(lines))
+
+
+def _CachedQuery(
+    seq: list[int],
+    info: bool,
+    cache: shelve.Shelf[int],
+    lock: Lock
+) -> tuple[int, list[str]]:
+    """QueryOEIS(seq, 1, info) with the A-numbers found so far kept in
+    the shelf data/oeis_cache. The key is a hash of the whole sequence,
+    since a retry without zeros sees terms far beyond the first query.
+    Only reliable hits are stored; a miss or a weak match is asked again
+    on the next run since the OEIS keeps growing, and so is a failed
+    connection.
+    The shelf is shared by the worker threads of AnumberDict, the lock
+    serializes the access to it. The output of the query is returned as
+    a list of lines, so that AnumberDict can print it in trait order.
+    """
+    lines: list[str] = []
+
+    def say(*args: object) -> None:
+        lines.append(" ".join(map(str, args)))
+
+    key = blake2b(str(seq).encode(), digest_size=16).hexdigest()
+    with lock:
+        anum = cache.get(key)
+    if anum is None:
+        anum, reliable = SearchOEIS(seq, 1, info, say=say)
+        if anum > 0 and reliable:
+            with lock:
+                cache[key] = anum
+    elif info:
+        say("Cached:", NumToAnum(anum))
+    return anum, lines
 
 
 def AnumberDict(
@@ -2528,16 +2630,36 @@ def AnumberDict(
 
     global GlobalDict
     print(f"*** Table {T.id} under construction ***")
-    trait_dict: Dict[str, int] = {}
+    # generate the trait data in this thread, only the queries are parallel.
+    seqs: Dict[str, list[int]] = {}
     for trid, tr in TraitsDict.items():
         # the key of the dictionary is the table name + trait name.
         name = T.id + "_" + trid
-        if info:
-            print(name)
-        # generate the trait data for the query
         seq: list[int] = tr[0](T, tr[1])
         if seq != []:
-            trait_dict[name] = QueryOEIS(seq, info)
+            seqs[name] = seq
+    # traits with the same sequence share one query.
+    distinct = {tuple(seq): seq for seq in seqs.values()}
+    with shelve.open(str(GetRoot("data/oeis_cache"))) as cache:
+        query = partial(_CachedQuery, info=info, cache=cache, lock=Lock())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            try:
+                results = dict(zip(distinct, executor.map(query, distinct.values())))
+            except BaseException:
+                # e.g. Ctrl-C: do not send the queries that are still waiting.
+                executor.shutdown(cancel_futures=True)
+                raise
+    # print the output of the queries in the order of the traits.
+    trait_dict: Dict[str, int] = {}
+    for trid in TraitsDict:
+        name = T.id + "_" + trid
+        if info:
+            print(name)
+        if name in seqs:
+            anum, lines = results[tuple(seqs[name])]
+            for line in lines:
+                print(line)
+            trait_dict[name] = anum
     if addtoglobal:
         GlobalDict[T.id] = trait_dict
     return trait_dict
@@ -2553,29 +2675,23 @@ def DictToHtml(T: Table, dict: Dict[str, int], info: bool = False) -> int:
     """
     hitpath = GetRoot(f"docs/{T.id}Traits.html")
     head = header.replace("NAMEXXX", T.id).replace("AXXXXXX", f"{T.oeis[0]}")
-    hits = doubles = 0
-    anumlist: set[int] = set()
+    hits = 0
+    rows: list[str] = [head]
+    for fullname, anum in sorted(dict.items(), key=itemgetter(1)):
+        trname = fullname.split("_")[1]
+        if info:
+            print(f"    {fullname} -> {anum}")  # prints sorted dict
+        tex = TraitsDict[trname][2]
+        if anum == 0:
+            continue
+        url = f"<a href='https://oeis.org/A{anum:06d}' target='OEISframe'>A{anum:06d}</a>"
+        rows.append(f"<tr><td>{url}</td><td>{trname}</td><td>{tex}</td></tr>")
+        hits += 1
+    rows.append(
+        "<tr><td colspan='3'><a href='https://peterluschny.github.io/tablInspector/index.html'>I N D E X</a></td></tr></tbody></table></div></body></html>"
+    )
     with open(hitpath, "w+", encoding="utf-8") as oeis:
-        oeis.write(head)
-        d = {k: v for k, v in sorted(dict.items(), key=lambda item: item[1])}
-        for fullname, anum in d.items():
-            trname = fullname.split("_")[1]
-            if info:
-                print(f"    {fullname} -> {anum}")  # prints sorted dict
-            traitfun, size, tex = TraitsDict[trname]  # type: ignore
-            if anum == 0:
-                continue
-            if anum in anumlist:
-                doubles += 1
-            Anum = "A" + str(anum).rjust(6, "0")
-            url = f"<a href='https://oeis.org/{Anum}' target='OEISframe'>{Anum}</a>"
-            row = f"<tr><td>{url}</td><td>{trname}</td><td>{tex}</td></tr>"
-            oeis.write(row)
-            hits += 1
-            anumlist.add(anum)
-
-        row = f"<tr><td colspan='3'><a href='https://peterluschny.github.io/tablInspector/index.html'>I N D E X</a></td></tr></tbody></table></div></body></html>"
-        oeis.write(row)
+        oeis.write("".join(rows))
     return hits
 
 
@@ -2587,32 +2703,28 @@ def RefreshHtml(filter: bool = False) -> None:
     the dictionary multiple A-numbers are removed.
     Args:
         filter (bool): If True, multiple A-numbers are removed before conversion. Defaults to False.
-    Raises:
-        KeyError: If a table's ID is not found in the global dictionary.
+    A table whose ID is not found in the global dictionary is reported and skipped.
     """
     global GlobalDict
     ReadJsonDict()
 
+    rows: list[str] = [indheader]
+    for T in TablesList:
+        try:
+            dict = GlobalDict[T.id]
+            if filter:
+                dict = FilterDict(dict)
+            DictToHtml(T, dict)  # type: ignore
+            rows.append(
+                f"<tr><td align='left'><a href='{T.id}Traits.html'>{T.id}</a></td></tr>"
+            )
+            print(T.id, "dict length:", len(dict))
+        except KeyError as e:
+            print("KeyError:", e, "- table skipped.")
+    rows.append("</tbody></table></body></html>")
     indexpath = GetRoot(f"docs/index.html")
     with open(indexpath, "w+", encoding="utf-8") as index:
-        index.write(indheader)
-        for T in TablesList:
-            try:
-                dict = GlobalDict[T.id]
-                if filter:
-                    dict = FilterDict(dict)
-                DictToHtml(T, dict)  # type: ignore
-                index.write(
-                    f"<tr><td align='left'><a href='{T.id}Traits.html'>{T.id}</a></td></tr>"
-                )
-                print(T.id, "dict length:", len(dict))
-            except KeyError as e:
-                print("KeyError:", e)
-                input()
-                pass
-
-        index.write("</tbody></table></body></html>")
-        index.flush()
+        index.write("".join(rows))
 
 
 indheader = "<!DOCTYPE html><html lang='en'><head><title>Index</title><meta name='viewport' content='width=device-width,initial-scale=1'><style type='text/css'>body{ font-family: Calabri, Arial, sans-serif; font-size: 16px; background-color: #2f3332; color: #0f0f0f} a{ text-decoration: none;} tbody td:hover{ background-color: greenyellow;} table, td,th{ background-color: lightgrey; border: 2px solid black; border-collapse: collapse; margin-left: 16px; padding-left: 10px; padding-top: 4px;} </style><base href='https://peterluschny.github.io/tablInspector/' target='_blank'></head><body><table><thead><tr><th align='left'>Triangle Inspector</th></tr></thead><tbody><tr>"
@@ -2627,42 +2739,38 @@ def RefreshDatabase() -> None:
     print("Warning: This will take some time.")
     global GlobalDict
     ReadJsonDict()
+    rows: list[str] = [indheader]
+    for T in TablesList:
+        dict = AnumberDict(T, True, True)  # type: ignore
+        DictToHtml(T, dict, False)  # type: ignore
+        rows.append(
+            f"<tr><td align='left'>{T.id}</td><td align='left'><a href='{T.id}Traits.html'>[online]</a></td></tr>"
+        )
+        AddAnumsToSrcfile(T.id, dict)
+    rows.append("</tbody></table></body></html>")
     indexpath = GetRoot(f"docs/index.html")
     with open(indexpath, "w+", encoding="utf-8") as index:
-        index.write(indheader)
-        for T in TablesList:
-            dict = AnumberDict(T, True, True)  # type: ignore
-            DictToHtml(T, dict, False)  # type: ignore
-            index.write(
-                f"<tr><td align='left'>{T.id}</td><td align='left'><a href='{T.id}Traits.html'>[online]</a></td></tr>"
-            )
-            AddAnumsToSrcfile(T.id, dict)
-        index.write("</tbody></table></body></html>")
-        index.flush()
+        index.write("".join(rows))
     # Save to a JSON file
-    jsonpath = GetRoot(f"data/AllTraits.json")
-    with open(jsonpath, "w") as fileson:
-        json.dump(GlobalDict, fileson)
+    WriteJsonDict()
 
 
-def AddTable(T: Table, dict: Dict[str, int] = {}) -> Dict[str, int]:
+def AddTable(T: Table, dict: Dict[str, int] | None = None) -> Dict[str, int]:
     """
     Adds a table to a dictionary, i.e. it reads a JSON dictionary,
     updates it with the provided table, and converts the dictionary to HTML.
     Args:
         T (Table): The table to be added.
         dict (Dict[str, int], optional): A dictionary to be updated.
-        Defaults to an empty dictionary.
+        Defaults to None, then the dictionary is generated with AnumberDict.
     Returns:
         Dict[str, int]: The updated dictionary.
     """
     ReadJsonDict()
-    if dict == {}:  # info, add2globalDict
+    if not dict:  # info, add2globalDict
         dict = AnumberDict(T, True, True)
     print("Dict length:", len(dict))
-    datapath = GetRoot(f"data/AllTraits.json")
-    with open(datapath, "w+") as alltraits:
-        json.dump(GlobalDict, alltraits)
+    WriteJsonDict()
     DictToHtml(T, dict, True)
     return dict
 
@@ -3004,14 +3112,17 @@ BinaryPell = Table(
 def binomial(n: int) -> list[int]:
     if n == 0:
         return [1]
-    row: list[int] = [1] + binomial(n - 1)
-    for k in range(1, n):
-        row[k] += row[k + 1]
+    prev = binomial(n - 1)
+    row: list[int] = [1] * (n + 1)
+    for k in range(1, n // 2 + 1):
+        row[k] = row[n - k] = prev[k - 1] + prev[k]
     return row
 
 
 def invbinomial(n: int) -> list[int]:
-    return [(-1) ** (n - k) * binomial(n)[k] for k in range(n + 1)]
+    row = binomial(n).copy()
+    row[1 - n % 2 :: 2] = [-b for b in row[1 - n % 2 :: 2]]
+    return row
 
 
 Binomial = Table(
@@ -3041,7 +3152,9 @@ InvBinomial = Table(
 
 @cache
 def binomialinv(n: int) -> list[int]:
-    return [(-1) ** (n - k) * binomial(n)[k] for k in range(n + 1)]
+    row = binomial(n).copy()
+    row[1 - n % 2 :: 2] = [-b for b in row[1 - n % 2 :: 2]]
+    return row
 
 
 BinomialInv = Table(
@@ -3238,10 +3351,9 @@ CentralCycle = Table(
 def centralfactorial(n: int) -> list[int]:
     if n == 0:
         return [1]
-    row = [1] * (n + 1)
-    for k in range(0, n):
-        row[k + 1] = row[k] * (n * n - k * k)
-    return row
+    n2 = n * n
+    squares = accumulate(range(1, 2 * n - 1, 2), initial=0)
+    return list(accumulate((n2 - k2 for k2 in squares), operator.mul, initial=1))
 
 
 CentralFactorial = Table(
@@ -3272,18 +3384,20 @@ CentralSet = Table(
     "A269944",  # also "A204579"
     r"is(k = n)\ ? \ 1 : T(n-1, k-1) + k^2\ T(n-1, k)",
 )
+_centralsetinv_rows: list[list[int]] = [[1], [0, 1]]
+_centralsetinv_lock = Lock()
 
 
-@cache
 def centralsetinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [0, 1]
-    row = centralsetinv(n - 1) + [1]
-    for k in range(n - 1, 0, -1):
-        row[k] = (n - 1) ** 2 * row[k] + row[k - 1]
-    return row
+    rows = _centralsetinv_rows
+    with _centralsetinv_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            m2 = (m - 1) ** 2
+            prev = rows[-1]
+            row = [0] + [m2 * a + b for a, b in zip(prev[1:], prev)] + [1]
+            rows.append(row)
+    return rows[n]
 
 
 CentralSetInv = Table(
@@ -3406,28 +3520,33 @@ ChebyshevU = Table(
     "",  # not integer-invertible
     r"2^k \binom{(n+k)/2}{k} \text{A369736}(n, k)",
 )
+_clp_rows: list[list[int]] = []
+_clp_lock = Lock()
 
 
-@cache
-def _clp(n: int, k: int) -> int:
-    if k < 0 or k > n:
-        return 0
-    if k == 0 or k == n:
-        return 1
-    return (
-        2 * _clp(n - 1, k)
-        + _clp(n - 1, k - 1)
-        - 2 * _clp(n - 2, k - 1)
-        + _clp(n - k - 1, k - 1)
-        - _clp(n - k - 2, k)
-    )
+def _clp(n: int) -> list[int]:
+    T = _clp_rows
+    with _clp_lock:
+        while len(T) <= n:
+            m = len(T)
+            row = [1] * (m + 1)
+            if m > 1:
+                p1, p2 = T[m - 1], T[m - 2]
+                for j in range(1, m):
+                    row[j] = 2 * (p1[j] - p2[j - 1]) + p1[j - 1]
+                for j in range(1, m // 2 + 1):
+                    row[j] += T[m - j - 1][j - 1]
+                for j in range(1, m // 2):
+                    row[j] -= T[m - j - 2][j]
+            T.append(row)
+    return T[n]
 
 
 @cache
 def compositionlp(n: int) -> list[int]:
     if n == 0:
         return [1]
-    return [_clp(n - 1, k - 1) for k in range(n + 1)]
+    return [0] + _clp(n - 1)
 
 
 CompositionLP = Table(
@@ -3512,17 +3631,21 @@ Delannoy = Table(
     "A132372",
     r"\text{Hyper}([-k, k - n], [1], 2)",
 )
+_delannoyinv_rows: list[list[int]] = [[1]]
+_delannoyinv_lock = Lock()
 
 
-@cache
 def delannoyinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    d = delannoyinv(n - 1)
-    row = [sum(d)] + d
-    for k in range(n - 1, 0, -1):
-        row[k] = row[k + 1] + d[k - 1] + d[k]
-    return row
+    rows = _delannoyinv_rows
+    with _delannoyinv_lock:
+        while len(rows) <= n:
+            # With the suffix sums D[k] = d[k] + ... + d[-1] of the previous
+            # row the recurrence T(n, k) = T(n, k+1) + d[k-1] + d[k] unfolds
+            # to T(n, 0) = D[0] and T(n, k) = D[k-1] + D[k] for k > 0.
+            D = list(accumulate(reversed(rows[-1])))
+            D.reverse()
+            rows.append([D[0]] + list(map(operator.add, D, D[1:] + [0])))
+    return rows[n]
 
 
 DelannoyInv = Table(
@@ -3532,17 +3655,32 @@ DelannoyInv = Table(
     "A008288",
     r"%%",
 )
+_distlattices_cols: list[list[int]] = []
+_distlattices_lock = Lock()
+
+
+def _distlattices_fill(N: int) -> list[list[int]]:
+    cols = _distlattices_cols
+    with _distlattices_lock:
+        for k in range(N + 1):
+            if k == len(cols):
+                cols.append([1])
+            col = cols[k]
+            for m in range(len(col), N - k + 1):
+                if k == 0:
+                    col.append(1)
+                    continue
+                prev = cols[k - 1]
+                conv = sum(map(operator.mul, prev[0:m:2], col[m - 1 :: -2]))
+                col.append(prev[m] + conv)
+    return cols
 
 
-@cache
 def _distlattices(n: int, k: int) -> int:
-    if k == 0 or n == 0:
-        return 1
-    s = [
-        _distlattices(2 * j, k - 1) * _distlattices(n - 1 - 2 * j, k)
-        for j in range(1 + (n - 1) // 2)
-    ]
-    return sum(s) + _distlattices(n, k - 1)
+    cols = _distlattices_cols
+    if k >= len(cols) or n >= len(cols[k]):
+        cols = _distlattices_fill(n + k)
+    return cols[k][n]
 
 
 @cache
@@ -3623,19 +3761,20 @@ DyckPaths = Table(
 )
 
 
-@cache
+_dyckpathsinv_rows: list[list[int]] = [[1], [1, 1]]
+_dyckpathsinv_lock = Lock()
+
+
 def dyckpathsinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [1, 1]
-    q = dyckpathsinv(n - 2) + [0]
-    p = dyckpathsinv(n - 1) + [0]
-    row = p.copy()
-    row[n] = 1
-    for k in range(n - 1, 0, -1):
-        row[k] = p[k - 1] + 2 * p[k] - q[k]
-    return row
+    rows = _dyckpathsinv_rows
+    with _dyckpathsinv_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            q, p = rows[-2], rows[-1]
+            row = [1] + [p[k - 1] + 2 * p[k] - q[k] for k in range(1, m - 1)]
+            row += [p[m - 2] + 2 * p[m - 1], 1]
+            rows.append(row)
+    return rows[n]
 
 
 DyckPathsInv = Table(
@@ -3774,20 +3913,18 @@ EulerianB = Table(eulerianb, "EulerianB", ["A060187", "A138076"], "A000000", r"%
 
 @cache
 def eulerianzigzag(n: int) -> list[int]:
-    b = binomial(n + 1)
+    b = [-t if j & 1 else t for j, t in enumerate(binomial(n + 1))]
     return [
-        sum((-1) ** j * b[j] * _distlattices(n, k - j) for j in range(k + 1))
-        for k in range(n + 1)
+        sum(b[j] * _distlattices(n, k - j) for j in range(k + 1)) for k in range(n + 1)
     ]
 
 
 @cache
 def ezz(n: int) -> list[int]:
     n += 2
-    b = binomial(n + 1)
+    b = [-t if j & 1 else t for j, t in enumerate(binomial(n + 1))]
     return [
-        sum((-1) ** j * b[j] * _distlattices(n, k - j) for j in range(k + 1))
-        for k in range(n - 1)
+        sum(b[j] * _distlattices(n, k - j) for j in range(k + 1)) for k in range(n - 1)
     ]
 
 
@@ -3869,12 +4006,7 @@ EytzingerPerm = Table(eytzingerperm, "EytzingerPerm", ["A375469"], "", r"%%")
 
 @cache
 def fallingfactorial(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    r = fallingfactorial(n - 1)
-    row = [n * r[k] for k in range(-1, n)]
-    row[0] = 1
-    return row
+    return list(accumulate(range(n, 0, -1), operator.mul, initial=1))
 
 
 FallingFactorial = Table(
@@ -4311,14 +4443,17 @@ Lucas = Table(
 )
 
 
-@cache
+_lucasinv_rows: list[list[int]] = [[1]]
+_lucasinv_lock = Lock()
+
+
 def lucasinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    r = [1] + lucasinv(n - 1)
-    for k in range(1, n):
-        r[k] += 2 * r[k + 1]
-    return r
+    rows = _lucasinv_rows
+    with _lucasinv_lock:
+        while len(rows) <= n:
+            p = rows[-1]
+            rows.append([1] + [a + 2 * b for a, b in zip(p, p[1:])] + [1])
+    return rows[n]
 
 
 LucasInv = Table(
@@ -4421,18 +4556,20 @@ Motzkin = Table(
 )
 
 
-@cache
+_motzkininv_rows: list[list[int]] = [[1], [-1, 1]]
+_motzkininv_lock = Lock()
+
+
 def motzkininv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [-1, 1]
-    r2 = motzkininv(n - 2) + [0]
-    r1 = motzkininv(n - 1) + [0]
-    r = motzkininv(n - 1) + [1]
-    for k in range(0, n):
-        r[k] = r1[k - 1] - r2[k] - r1[k]
-    return r
+    rows = _motzkininv_rows
+    with _motzkininv_lock:
+        while len(rows) <= n:
+            q, p = rows[-2], rows[-1]
+            row = [-q[0] - p[0]]
+            row += [a - c - b for a, b, c in zip(p, p[1:], q[1:])]
+            row += [p[-2] - p[-1], 1]
+            rows.append(row)
+    return rows[n]
 
 
 MotzkinInv = Table(
@@ -4487,17 +4624,27 @@ Narayana = Table(
 )
 
 
-@cache
+_narayana2_rows: list[list[int]] = [[1], [0, 1], [0, 1, 1]]
+_narayana2_lock = Lock()
+
+
 def narayana2(n: int) -> list[int]:
-    if n < 3:
-        return ([1], [0, 1], [0, 1, 1])[n]
-    a = narayana2(n - 2) + [0, 0]
-    b = narayana2(n - 1) + [1]
-    for k in range(n - 1, 1, -1):
-        b[k] = (
-            (b[k] + b[k - 1]) * (2 * n - 3) - (a[k] - 2 * a[k - 1] + a[k - 2]) * (n - 3)
-        ) // n
-    return b
+    rows = _narayana2_rows
+    with _narayana2_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            a = rows[-2] + [0, 0]
+            b = rows[-1]
+            s, t = 2 * m - 3, m - 3
+            rows.append(
+                b[:2]
+                + [
+                    ((b[k] + b[k - 1]) * s - (a[k] - 2 * a[k - 1] + a[k - 2]) * t) // m
+                    for k in range(2, m)
+                ]
+                + [1]
+            )
+    return rows[n]
 
 
 Narayana2 = Table(
@@ -4722,30 +4869,51 @@ Pascal = Table(
 )
 
 
-@cache
-def divisors(n: int) -> list[int]:
-    return [d for d in range(n, 0, -1) if n % d == 0]
-
-
-@cache
-def _h(n: int, k: int) -> int:
-    return sum(d * _T(d, k) for d in divisors(n))
+_TC: list[list[int]] = []
+_HC: list[list[int]] = []
+
+
+def _polyatreefill(N: int) -> None:
+    while len(_TC) <= N:
+        _TC.append([0])
+        _HC.append([0])
+    zeros = [0] * (N + 1)
+    for k in range(N + 1):
+        t, h = _TC[k], _HC[k]
+        hp = _HC[k - 1] if k > 0 else zeros
+        lo = len(t)
+        for n in range(lo, N + 1):
+            if n == 1:
+                t.append(int(k > 0))
+            elif n < k:
+                t.append(_TC[n][n])
+            else:
+                t.append(sum(t[i] * hp[n - i] for i in range(1, n)) // (n - 1))
+        # h(m, k) receives d T(d, k) from each divisor d of the new m >= lo.
+        h.extend([0] * (N + 1 - lo))
+        for d in range(1, N + 1):
+            dt = d * t[d]
+            for m in range(max(d, -(-lo // d) * d), N + 1, d):
+                h[m] += dt
 
 
-@cache
-def _T(n: int, k: int) -> int:
-    if n == 1:
-        return int(k > 0)
-    return sum(_T(i, k) * _h(n - i, k - 1) for i in range(1, n)) // (n - 1)
+_polyatreeacc_rows: list[list[int]] = []
+_polyatreeacc_lock = Lock()
 
 
-@cache
 def polyatreeacc(n: int) -> list[int]:
     if n > 200:
         # raise ValueError("n is too large for this function.")
         print(f"ValueError: n = {n} is too large for function polyatreeacc.")
         return []
-    return [_T(n + 1, k + 1) for k in range(n + 1)]
+    rows = _polyatreeacc_rows
+    with _polyatreeacc_lock:
+        if len(rows) <= n:
+            _polyatreefill(n + 1)
+        while len(rows) <= n:
+            m = len(rows)
+            rows.append([_TC[k + 1][m + 1] for k in range(m + 1)])
+    return rows[n]
 
 
 PolyaTreeAcc = Table(polyatreeacc, "PolyaTreeAcc", ["A375467"], "", r"%%")
@@ -4805,12 +4973,18 @@ PowLaguerre = Table(
 )
 
 
-@cache
+_powers_rows: list[list[int]] = [[1]]
+_powers_lock = Lock()
+
+
 def powers(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    lrow = powers(n - 1)
-    return [k * lrow[k] for k in range(n)] + [1]
+    rows = _powers_rows
+    with _powers_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            prev = rows[-1]
+            rows.append([k * prev[k] for k in range(m)] + [1])
+    return rows[n]
 
 
 Powers = Table(
@@ -4843,11 +5017,18 @@ Rencontres = Table(
 )
 
 
-@cache
+_rencontresinv_rows: list[list[int]] = [[1]]
+_rencontresinv_lock = Lock()
+
+
 def rencontresinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    return [(n - k - 1) * binomial(n)[k] for k in range(n)] + [1]
+    rows = _rencontresinv_rows
+    with _rencontresinv_lock:
+        while len(rows) <= n:
+            m = len(rows)
+            b = binomial(m)
+            rows.append([(m - k - 1) * b[k] for k in range(m)] + [1])
+    return rows[n]
 
 
 RencontresInv = Table(
@@ -4861,13 +5042,7 @@ RencontresInv = Table(
 
 @cache
 def risingfactorial(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    row = [1 for _ in range(n + 1)]
-    row[1] = n
-    for k in range(1, n):
-        row[k + 1] = row[k] * (n + k)
-    return row
+    return list(accumulate(range(n, 2 * n), operator.mul, initial=1))
 
 
 RisingFactorial = Table(
@@ -4915,17 +5090,17 @@ Schroeder = Table(
 )
 
 
-@cache
+_schroederinv_rows: list[list[int]] = [[1], [0, 1]]
+_schroederinv_lock = Lock()
+
+
 def schroederinv(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    if n == 1:
-        return [0, 1]
-    arow = schroederinv(n - 2) + [1]
-    row = schroederinv(n - 1) + [1]
-    for k in range(n - 1, 0, -1):
-        row[k] += row[k - 1] + arow[k - 1]
-    return row
+    rows = _schroederinv_rows
+    with _schroederinv_lock:
+        while len(rows) <= n:
+            q, p = rows[-2], rows[-1]
+            rows.append(p[:1] + [a + b + c for a, b, c in zip(p[1:], p, q)] + [1])
+    return rows[n]
 
 
 SchroederInv = Table(
@@ -5036,16 +5211,20 @@ StirlingCycle2 = Table(
 )
 
 
-@cache
+_stirlingcycleb_rows: list[list[int]] = [[1]]
+_stirlingcycleb_lock = Lock()
+
+
 def stirlingcycleb(n: int) -> list[int]:
-    if n == 0:
-        return [1]
-    row = stirlingcycleb(n - 1) + [1]
-    m = 2 * n - 1
-    for k in range(n - 1, 0, -1):
-        row[k] = m * row[k] + row[k - 1]
-    row[0] *= m
-    return row
+    rows = _stirlingcycleb_rows
+    with _stirlingcycleb_lock:
+        while len(rows) <= n:
+            m = 2 * len(rows) - 1
+            prev = rows[-1]
+            rows.append(
+                [m * prev[0]] + [m * a + b for a, b in zip(prev[1:], prev)] + [1]
+            )
+    return rows[n]
 
 
 StirlingCycleB = Table(
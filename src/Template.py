@@ -4,6 +4,12 @@ from _tabltypes import Table
 """Template.  This is a demonstration file producing a valid "Table" class.
    The including file has to be named "Template.py", the class "Template"
    and the generating function "template" (that should be decorated with "@cache").
+   A cached row is returned as the same list on every call, so repeated calls
+   do not allocate. Recurrences that build row n from row n - 1 may instead
+   keep their rows in a module-level list, as in "CentralSetInv.py". The loop
+   that extends the list runs under a module-level threading.Lock, since two
+   threads extending it at once could append the same row twice. Such a
+   file marks the start of its code with the line "# #@".
 
    After you have defined the class and the generating function, add the
    name of the file and the name of the class to the lists in the file
@@ -10,24 +10,29 @@ Functions:
         Dumps the global dictionary to standard output.
     ReadJsonDict() -> Dict[str, Dict[str, int]]:
         Loads the file data/AllTraits.json into the global dictionary GlobalDict.
-        Returns the global dictionary.
+        Returns the global dictionary. The file is only parsed again if it changed.
+    InvalidateJsonDict() -> None:
+        Forgets the cached AllTraits.json; called after the file is written.
+    WriteJsonDict() -> None:
+        Saves the global dictionary to data/AllTraits.json if it changed, via a temporary file.
     FilterDict(olddict: Dict[str, int]) -> Dict[str, int]:
         Creates a new dictionary with unique A-numbers from the old dictionary.
         Returns the new dictionary.
-    AddAnumsToSrcfile(name: str, dict: Dict[str, int] = {}) -> None:
+    AddAnumsToSrcfile(name: str, dict: Dict[str, int] | None = None) -> None:
         Adds an OEIS section to the source file of a table.
     AnumberDict(T: Table, info: bool = False, addtoglobal: bool = False) -> Dict[str, int]:
         Collects the A-numbers of the traits of the given table that are present in the OEIS.
+        A-numbers found before are read from the shelf data/oeis_cache.
         Returns a dictionary of traits and their A-numbers.
-    DictToHtml(T: Table, dict: Dict[str, int], info: bool = False) -> tuple[int, int, int]:
-        Transforms a dictionary {trait, anum} of the Table T into two HTML files: TNameTraits.html and TNameMissing.html.
-        Returns a tuple of distinct A-numbers, hits, and misses.
+    DictToHtml(T: Table, dict: Dict[str, int], info: bool = False) -> int:
+        Transforms a dictionary {trait, anum} of the Table T into the HTML file TNameTraits.html.
+        Returns the number of hits.
     RefreshHtml(filter: bool = False) -> None:
         Refreshes the HTML files for all tables in TablesList.
     RefreshDatabase() -> None:
         Generates the traits for all tables in TablesList and writes them in HTML format to files in the docs directory.
         Saves the trait dictionaries in a JSON file in the data directory.
-    AddTable(T: Table, dict: Dict[str, int] = {}) -> Dict[str, int]:
+    AddTable(T: Table, dict: Dict[str, int] | None = None) -> Dict[str, int]:
         Adds a table to the global dictionary and saves it to the JSON file.
         Returns the dictionary of traits and their A-numbers.
     InspectTable(T: Table, oeis: bool = False) -> None:
@@ -36,11 +41,17 @@ Functions:
 
 from Tables import TablesList
 from _tabltypes import Table
-from _tabloeis import QueryOEIS
+from _tabloeis import SearchOEIS
 from _tabltraits import TraitsDict, TableTraits
 from _tablutils import NumToAnum, TableGenerationTime
 from pathlib import Path
 from typing import Dict
+from operator import itemgetter
+from hashlib import blake2b
+from functools import cache, partial
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+import shelve
 import json
 
 
@@ -49,6 +60,7 @@ import json
 GlobalDict: Dict[str, Dict[str, int]] = {}
 
 
+@cache
 def GetRoot(name: str = '') -> Path:
     path = Path(__file__).parent.parent
     return (path / name).resolve()
@@ -63,18 +75,34 @@ def ShowGlobalDict() -> None:
             print(f"    {trait} -> {dict[trait]}")
 
 
+# The mtime of data/AllTraits.json together with the dictionary loaded from it.
+# ReadJsonDict hands out copies, so changes to GlobalDict do not reach it.
+_jsoncache: tuple[int, Dict[str, Dict[str, int]]] | None = None
+
+
+def InvalidateJsonDict() -> None:
+    """Forget the cached AllTraits.json; the next ReadJsonDict() parses the file again."""
+    global _jsoncache
+    _jsoncache = None
+
+
 def ReadJsonDict() -> Dict[str, Dict[str, int]]:
     """Loaded the file data/AllTraits.json into the global dictionary GlobalDict.
     In case of a FileNotFoundError a new empty dictionary is created.
+    The file is parsed again only if it was modified since the last call.
+    Unsaved changes to GlobalDict are dropped, as with a fresh parse.
 
     Returns:
         Dict[str, Dict[str, int]]: A global dictionary containing traits dictionaries.
     """
-    global GlobalDict
+    global GlobalDict, _jsoncache
     jsonpath = GetRoot(f"data/AllTraits.json")
     try:
-        with open(jsonpath, 'r') as file:
-            GlobalDict = json.load(file)
+        mtime = jsonpath.stat().st_mtime_ns
+        if _jsoncache is None or _jsoncache[0] != mtime:
+            with open(jsonpath, 'r') as file:
+                _jsoncache = (mtime, json.load(file))
+        GlobalDict = {tabl: dict(traits) for tabl, traits in _jsoncache[1].items()}
     except FileNotFoundError:
         print("No file 'AllTraits.json' found.")
         GlobalDict = {}
@@ -85,6 +113,21 @@ def ReadJsonDict() -> Dict[str, Dict[str, int]]:
     return GlobalDict
 
 
+def WriteJsonDict() -> None:
+    """Save the global dictionary GlobalDict to data/AllTraits.json.
+    Nothing is written if the file already holds these data. Otherwise
+    the data goes to a temporary file that then replaces AllTraits.json,
+    so an interrupted write leaves the old file intact.
+    """
+    jsonpath = GetRoot(f"data/AllTraits.json")
+    if jsonpath.is_file() and json.loads(jsonpath.read_text()) == GlobalDict:
+        return
+    tmppath = jsonpath.with_suffix(".json.tmp")
+    tmppath.write_text(json.dumps(GlobalDict))
+    tmppath.replace(jsonpath)
+    InvalidateJsonDict()
+
+
 def FilterDict(olddict: Dict[str, int] )  -> Dict[str, int]:
     """Make a new dictionary with unique A-numbers.
 
@@ -94,45 +137,41 @@ def FilterDict(olddict: Dict[str, int] )  -> Dict[str, int]:
     Returns:
         Dict[str, int]: A-numbers can appear at most once.
     """
-    anumlist: set[int] = set()
-    newdict: Dict[str, int] = {}
+    # the first trait with a given A-number keeps it.
+    first: Dict[int, str] = {}
     for k, v in olddict.items():
-        if not v in anumlist: 
-            newdict[k] = v
-        anumlist.add(v)
-    return newdict
+        first.setdefault(v, k)
+    return {k: v for v, k in first.items()}
 
 
 def TruncateInfo(srcpath: Path) -> None:
     """
-    The function reads the file line by line and writes back the content 
-    up to (but not including) the line that starts with the OEIS marker 
-    (''' OEIS). Once the marker is found, the file is truncated at that point.
+    The function reads the file line by line up to the line that starts
+    with the OEIS marker (''' OEIS) and truncates the file at the start of
+    this line. The content before the marker is not rewritten.
     Args:
         srcpath (Path): The path to the file to be truncated.
     """
-    oeis_marker = "''' OEIS"
-    with open(srcpath, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    with open(srcpath, "w", encoding="utf-8") as f:
-        for line in lines:
+    oeis_marker = b"''' OEIS"
+    offset = 0
+    with open(srcpath, "r+b") as f:
+        for line in f:
             if line.startswith(oeis_marker):
-                f.truncate(f.tell())
+                f.truncate(offset)
                 break
-            f.write(line)
+            offset += len(line)
 
 
 def AddAnumsToSrcfile(
     name: str, 
-    dict: Dict[str, int] = {}
+    dict: Dict[str, int] | None = None
 ) -> None:
     """Add an OEIS section to the source file of a table.
 
     Args:
         name (str): name of the table
         dict (Dict[str, int], optional): where the OEIS infos are. 
-        Defaults to {} which in turn triggers the use of the gloabl dictionary.
+        Defaults to None which in turn triggers the use of the gloabl dictionary.
 
     Example:
        AddAnumsToSrcfile("Catalan") will add the following line to src/Catalan.py 
@@ -143,28 +182,63 @@ def AddAnumsToSrcfile(
     
     global GlobalDict
 
-    if dict == {}:
+    if not dict:
         ReadJsonDict()
         dict = GlobalDict[name]
 
     srcpath = GetRoot(f"src/{name}.py")
     TruncateInfo(srcpath)
 
+    anums = dict.values()
+    lines: list[str] = ["\n\n" + r"'''" + " OEIS\n"]
+    for fullname, anum in sorted(dict.items(), key=itemgetter(1)):
+        if anum != 0:
+            lines.append(f"    {fullname} -> https://oeis.org/A{anum}\n")
+        else:
+            lines.append(f"    {fullname} -> 0 \n")
+
+    misses = len([v for v in anums if v == 0])
+    hits = len(anums) - misses
+    distincts = len(set(anums))
+
+    lines.append(f"\n    {name}: Distinct: {distincts}, Hits: {hits}, Misses: {misses}")
+    lines.append("\n" + r"'''" + "\n")
     with open(srcpath, "a+", encoding="utf-8") as dest:
-        d = {k: v for k, v in sorted(dict.items(), key=lambda item: item[1])}
-        dest.write("\n\n" + r"'''" + " OEIS\n")
-        for fullname, anum in d.items():
-            if anum != 0:
-                dest.write(f"    {fullname} -> https://oeis.org/A{anum}\n")
-            else:
-                dest.write(f"    {fullname} -> 0 \n")
+        dest.write("".join(lines))
+
+
+def _CachedQuery(
+    seq: list[int],
+    info: bool,
+    cache: shelve.Shelf[int],
+    lock: Lock
+) -> tuple[int, list[str]]:
+    """QueryOEIS(seq, 1, info) with the A-numbers found so far kept in
+    the shelf data/oeis_cache. The key is a hash of the whole sequence,
+    since a retry without zeros sees terms far beyond the first query.
+    Only reliable hits are stored; a miss or a weak match is asked again
+    on the next run since the OEIS keeps growing, and so is a failed
+    connection.
+    The shelf is shared by the worker threads of AnumberDict, the lock
+    serializes the access to it. The output of the query is returned as
+    a list of lines, so that AnumberDict can print it in trait order.
+    """
+    lines: list[str] = []
 
-        misses = len([v for v in d.values() if v == 0])
-        hits = len(d.values()) - misses
-        distincts = len(set(d.values()))
+    def say(*args: object) -> None:
+        lines.append(" ".join(map(str, args)))
 
-        dest.write(f"\n    {name}: Distinct: {distincts}, Hits: {hits}, Misses: {misses}")
-        dest.write("\n" + r"'''" + "\n")
+    key = blake2b(str(seq).encode(), digest_size=16).hexdigest()
+    with lock:
+        anum = cache.get(key)
+    if anum is None:
+        anum, reliable = SearchOEIS(seq, 1, info, say=say)
+        if anum > 0 and reliable:
+            with lock:
+                cache[key] = anum
+    elif info:
+        say("Cached:", NumToAnum(anum))
+    return anum, lines
 
 
 def AnumberDict(
@@ -187,15 +261,37 @@ def AnumberDict(
     global GlobalDict
     print(f"*** Table {T.id} under construction ***")
 
-    trait_dict: Dict[str, int] = {}
+    # generate the trait data in this thread, only the queries are parallel.
+    seqs: Dict[str, list[int]] = {}
     for trid, tr in TraitsDict.items():
         # the key of the dictionary is the table name + trait name.
         name = (T.id + '_' + trid)
-        if info: print(name)
-        # generate the trait data for the query
         seq: list[int] = tr[0](T, tr[1])
         if seq != []:
-            trait_dict[name] = QueryOEIS(seq, info)
+            seqs[name] = seq
+
+    # traits with the same sequence share one query.
+    distinct = {tuple(seq): seq for seq in seqs.values()}
+    with shelve.open(str(GetRoot("data/oeis_cache"))) as cache:
+        query = partial(_CachedQuery, info=info, cache=cache, lock=Lock())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            try:
+                results = dict(zip(distinct, executor.map(query, distinct.values())))
+            except BaseException:
+                # e.g. Ctrl-C: do not send the queries that are still waiting.
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    # print the output of the queries in the order of the traits.
+    trait_dict: Dict[str, int] = {}
+    for trid in TraitsDict:
+        name = (T.id + '_' + trid)
+        if info: print(name)
+        if name in seqs:
+            anum, lines = results[tuple(seqs[name])]
+            for line in lines:
+                print(line)
+            trait_dict[name] = anum
 
     if addtoglobal:
         GlobalDict[T.id] = trait_dict
@@ -217,31 +313,22 @@ def DictToHtml(
     hitpath = GetRoot(f"docs/{T.id}Traits.html")
     head = header.replace("NAMEXXX", T.id).replace("AXXXXXX", f"{T.oeis[0]}")
 
-    hits = doubles = 0
-    anumlist: set[int] = set()
+    hits = 0
+    rows: list[str] = [head]
 
-    with open(hitpath, "w+", encoding="utf-8") as oeis:
+    for fullname, anum in sorted(dict.items(), key=itemgetter(1)):
+        trname = fullname.split('_')[1]
+        if info: print(f"    {fullname} -> {anum}") # prints sorted dict 
+        tex = TraitsDict[trname][2]
+        if anum == 0:
+            continue
+        url = f"<a href='https://oeis.org/A{anum:06d}' target='OEISframe'>A{anum:06d}</a>"
+        rows.append(f"<tr><td>{url}</td><td>{trname}</td><td>{tex}</td></tr>")
+        hits += 1
 
-        oeis.write(head)
-        d = {k: v for k, v in sorted(dict.items(), key=lambda item: item[1])}
-
-        for fullname, anum in d.items():
-            trname = fullname.split('_')[1]
-            if info: print(f"    {fullname} -> {anum}") # prints sorted dict 
-            traitfun, size, tex = TraitsDict[trname] # type: ignore
-            if anum == 0:
-                continue
-            if anum in anumlist: 
-                doubles += 1
-            Anum = 'A' + str(anum).rjust(6, "0")
-            url = f"<a href='https://oeis.org/{Anum}' target='OEISframe'>{Anum}</a>"
-            row = f"<tr><td>{url}</td><td>{trname}</td><td>{tex}</td></tr>"
-            oeis.write(row)
-            hits += 1
-            anumlist.add(anum)
-            
-        row = f"<tr><td colspan='3'><a href='https://peterluschny.github.io/tablInspector/index.html'>I N D E X</a></td></tr></tbody></table></div></body></html>"
-        oeis.write(row)
+    rows.append("<tr><td colspan='3'><a href='https://peterluschny.github.io/tablInspector/index.html'>I N D E X</a></td></tr></tbody></table></div></body></html>")
+    with open(hitpath, "w+", encoding="utf-8") as oeis:
+        oeis.write("".join(rows))
 
     return hits
 
@@ -257,33 +344,29 @@ def RefreshHtml(filter: bool=False) -> None:
     Args:
         filter (bool): If True, multiple A-numbers are removed before conversion. Defaults to False.
 
-    Raises:
-        KeyError: If a table's ID is not found in the global dictionary.
+    A table whose ID is not found in the global dictionary is reported and skipped.
     """
     global GlobalDict
     ReadJsonDict()
     
+    rows: list[str] = [indheader]
+    for T in TablesList:
+        try:
+            dict = GlobalDict[T.id]
+            if filter:
+                dict = FilterDict(dict)
+            DictToHtml(T, dict)    # type: ignore
+            rows.append(
+                f"<tr><td align='left'><a href='{T.id}Traits.html'>{T.id}</a></td></tr>"
+            )
+            print(T.id, "dict length:", len(dict))
+        except KeyError as e:
+            print("KeyError:", e, "- table skipped.")
+    rows.append("</tbody></table></body></html>")
+
     indexpath = GetRoot(f"docs/index.html")
     with open(indexpath, "w+", encoding="utf-8") as index:
-        index.write(indheader)
-
-        for T in TablesList:
-            try:
-                dict = GlobalDict[T.id]
-                if filter:
-                    dict = FilterDict(dict)
-                DictToHtml(T, dict)    # type: ignore
-                index.write(
-                    f"<tr><td align='left'><a href='{T.id}Traits.html'>{T.id}</a></td></tr>"
-                )
-                print(T.id, "dict length:", len(dict))
-            except KeyError as e: 
-                print("KeyError:", e)
-                input()
-                pass
-        
-        index.write("</tbody></table></body></html>")
-        index.flush()
+        index.write("".join(rows))
 
 
 indheader = "<!DOCTYPE html><html lang='en'><head><title>Index</title><meta name='viewport' content='width=device-width,initial-scale=1'><style type='text/css'>body{ font-family: Calabri, Arial, sans-serif; font-size: 16px; background-color: #2f3332; color: #0f0f0f} a{ text-decoration: none;} tbody td:hover{ background-color: greenyellow;} table, td,th{ background-color: lightgrey; border: 2px solid black; border-collapse: collapse; margin-left: 16px; padding-left: 10px; padding-top: 4px;} </style><base href='https://peterluschny.github.io/tablInspector/' target='_blank'></head><body><table><thead><tr><th align='left'>Triangle Inspector</th></tr></thead><tbody><tr>"
@@ -300,30 +383,27 @@ def RefreshDatabase() -> None:
     global GlobalDict
     ReadJsonDict()
 
+    rows: list[str] = [indheader]
+    for T in TablesList:
+        dict = AnumberDict(T, True, True)  # type: ignore
+        DictToHtml(T, dict, False)  # type: ignore
+        rows.append(
+            f"<tr><td align='left'>{T.id}</td><td align='left'><a href='{T.id}Traits.html'>[online]</a></td></tr>"
+        )
+        AddAnumsToSrcfile(T.id, dict)
+    rows.append("</tbody></table></body></html>")
+
     indexpath = GetRoot(f"docs/index.html")
     with open(indexpath, "w+", encoding="utf-8") as index:
-        index.write(indheader)
-
-        for T in TablesList:
-            dict = AnumberDict(T, True, True)  # type: ignore
-            DictToHtml(T, dict, False)  # type: ignore
-            index.write(
-                f"<tr><td align='left'>{T.id}</td><td align='left'><a href='{T.id}Traits.html'>[online]</a></td></tr>"
-            )
-            AddAnumsToSrcfile(T.id, dict)
-
-        index.write("</tbody></table></body></html>")
-        index.flush()
+        index.write("".join(rows))
 
     # Save to a JSON file
-    jsonpath = GetRoot(f"data/AllTraits.json")
-    with open(jsonpath, 'w') as fileson:
-        json.dump(GlobalDict, fileson)
+    WriteJsonDict()
 
 
 def AddTable(
     T: Table,
-    dict: Dict[str, int] = {}
+    dict: Dict[str, int] | None = None
 ) -> Dict[str, int]:
     """
     Adds a table to a dictionary, i.e. it reads a JSON dictionary, 
@@ -331,18 +411,16 @@ def AddTable(
     Args:
         T (Table): The table to be added.
         dict (Dict[str, int], optional): A dictionary to be updated. 
-        Defaults to an empty dictionary.
+        Defaults to None, then the dictionary is generated with AnumberDict.
     Returns:
         Dict[str, int]: The updated dictionary.
     """
     ReadJsonDict()
 
-    if dict == {}:        #info, add2globalDict
+    if not dict:        #info, add2globalDict
         dict = AnumberDict(T, True, True)
     print("Dict length:", len(dict))
-    datapath = GetRoot(f"data/AllTraits.json")
-    with open(datapath, 'w+') as alltraits:
-        json.dump(GlobalDict, alltraits)
+    WriteJsonDict()
     DictToHtml(T, dict, True)
     return dict
 
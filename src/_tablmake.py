@@ -9,6 +9,15 @@ Attributes:
     - import_header (list[str]): List of import statements to be included at the beginning of 'Tables.py'.
     
 Note that reference to modules like sympy, numpy, and scipy are excluded by design.
+For the same reason the numeric recurrences (for instance in CentralFactorial, 
+CompositionLP and DistLattices) are not compiled ahead of time with Numba or Cython: 
+their values leave the int64 range after a few rows, and a compiled extension 
+would break the single-file deployment of 'Tables.py'. They are written as 
+bottom-up loops in plain Python instead, which need no warm-up on import.
+Likewise the big integers stay Python ints rather than gmpy2.mpz: in the
+displayed range (for instance PolyaTreeAcc and Narayana2 up to n = 200) 
+the entries have about a hundred digits, below the size where GMP's 
+faster multiplication algorithms would make a difference.
 """
 
 from os import getcwd
@@ -282,6 +291,8 @@ TablesDict: dict[str, Table] = {
     os: Provides functions for interacting with the operating system.
     os.path: Provides functions for manipulating file paths.
     functools: Provides higher-order functions for functional programming.
+    concurrent.futures: Provides a thread pool for querying the OEIS.
+    threading: Provides the lock that paces and guards the OEIS queries.
     itertools: Provides functions for creating iterators for efficient looping.
     more_itertools: Provides additional iterator building blocks.
     math: Provides mathematical functions.
@@ -291,14 +302,17 @@ TablesDict: dict[str, Table] = {
     pathlib: Provides an object-oriented interface for filesystem paths.
     requests: Provides functions for making HTTP requests.
     json: Provides functions for parsing JSON.
+    shelve, hashlib: Provide the on-disk cache of the OEIS queries.
     sys: Provides access to system-specific parameters and functions.
     typing: Provides support for type hints.
 """
 import_header: list[str] = [
     "from functools import cache\n",
     "from itertools import accumulate, islice\n",
-    "from more_itertools import difference, flatten\n",
-    "from functools import reduce\n",
+    "from more_itertools import flatten\n",
+    "from functools import reduce, partial\n",
+    "from concurrent.futures import ThreadPoolExecutor\n",
+    "from threading import Lock\n",
     "from math import factorial, sqrt, lcm, gcd\n",
     "from fractions import Fraction\n",
     "import operator\n",
@@ -307,8 +321,9 @@ import_header: list[str] = [
     "from pathlib import Path\n",
     "import requests\n",
     "import json\n",
+    "import shelve\n",
+    "from hashlib import blake2b\n",
     "from ipywidgets import Dropdown\n",
-    "from requests import get\n",
     "import sys\n",
     "from sys import setrecursionlimit, set_int_max_str_digits\n",
     "from typing import Callable, TypeAlias, Iterator, Dict, Tuple, NamedTuple\n",
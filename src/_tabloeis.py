@@ -10,15 +10,21 @@ for a given sequence and determine if it is present in the database.
       The A-number of the sequence if found, 0 if the sequence was not found, 
       or -999999 if the OEIS server cannot be reached.
 
+  SearchOEIS(seqlist: list[int], maxnum: int = 1, info: bool = False, minlen: int = 24,
+             say: Callable[..., None] = print) -> tuple[int, bool]:
+    The search behind QueryOEIS. Returns the same A-number together with a flag
+    that tells whether the match is reliable, i.e. at least 12 terms match.
+    All output goes through say, which is print by default.
+
 The module also includes a function to find the longest common substring between two strings. 
 The function 'lcsubstr' is CC BY-SA 4.0 and taken from the Algorithm Implementation Wikibook.
 https://en.wikibooks.org/wiki/Algorithm_Implementation/Strings/Longest_common_substring
 """
 
 import time
-from typing import TypeAlias
+from threading import Lock
+from typing import Callable, TypeAlias
 import requests
-from requests import get
 from _tabltypes import Table, Trait
 from _tablutils import SeqToString
 
@@ -194,64 +200,65 @@ def lcsubstr(s: str, t: str) -> tuple[int, int]:
     return (x_longest - longest, longest)
 
 
-def QueryOEIS(
-        seqlist: list[int], 
-        maxnum: int = 1,
-        info: bool = False, 
-        minlen: int = 24 
-    ) -> int:
-    """
-    Query if a given sequence is present in the OEIS. At least 24 terms 
-    of the sequence must be given. The first three terms and signs are disregard. 
-    Sequences with huge terms might have to few terms to give reliable results. 
-    This is a heuristic function, understand it's limited reach.
+# QueryOEIS may run in several threads (see AnumberDict); the lock
+# keeps the requests at least half a second apart.
+_querylock = Lock()
+_lastquery = 0.0
 
-    Args:
-        seqlist: The sequence to search. Must have at least 24 terms.
+# All queries share one session, so the connection to oeis.org is
+# kept open between requests. Its pool holds up to 10 connections,
+# enough for the threads of AnumberDict.
+_session = requests.Session()
 
-        maxnum: max number of sequences to be returned. Defaults to 1.
 
-        info: Prints details, otherwise is quiet except for warnings. Defaults to False.
-        
-        minlen: At least {minlen} terms are required.
+def _Pace() -> None:
+    """Wait until half a second has passed since the previous request."""
+    global _lastquery
+    with _querylock:
+        wait = _lastquery + 0.5 - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _lastquery = time.monotonic()
 
-    Returns:
-        Returns anum is the A-number of the sequence, 
-        Returns 0 if the sequence was not found.
-        If sl < 5 and dl > 12, then anum probably matches the sequence,
-        modulo a couple of first terms and the signs.
 
-    Raises:
-        Exception: If the OEIS server cannot be reached after multiple attempts.
-        Currently, the function will return -999999 if the OEIS server cannot be reached.
+def SearchOEIS(
+        seqlist: list[int], 
+        maxnum: int = 1,
+        info: bool = False, 
+        minlen: int = 24,
+        say: Callable[..., None] = print
+    ) -> tuple[int, bool]:
+    """The search behind QueryOEIS. Also returns whether the match is
+    reliable, i.e. at least 12 terms match and no warning was printed.
+    All output goes through say, which is print by default.
     """
     if len(seqlist) < minlen:
-      print(f"Sequence is too short! We require at least {minlen} terms.")
-      print("You provided:", seqlist)
-      return 0
+      say(f"Sequence is too short! We require at least {minlen} terms.")
+      say("You provided:", seqlist)
+      return 0, False
 
-    if 0 == sum(seqlist[0:36]): return 4  # XXXXX dont search for the all zeros sequence
+    if 0 == sum(seqlist[0:36]): return 4, True  # XXXXX dont search for the all zeros sequence
     off = 0 if 0 == sum(seqlist[3:36]) else 3   # XXXXX dont skip leading terms if the rest is zero
     seqstr = SeqToString(seqlist, 160, 36, ",", off, True)
     url = f"https://oeis.org/search?q={seqstr}&fmt=json"
 
     for _ in range(4):      
-        time.sleep(0.5)  # give the OEIS server some time to relax
+        _Pace()  # give the OEIS server some time to relax
         # if debug: print(f"connecting: [{repeat}]")
         try:
-            # jdata: None | list[dict[str, int | str | list[str] ]] = get(url, timeout=30).json()
-            jdata = get(url, timeout=30).json()
+            # jdata: None | list[dict[str, int | str | list[str] ]] = _session.get(url, timeout=30).json()
+            jdata = _session.get(url, timeout=30).json()
             if jdata == None:
                 if 0 == sum(seqlist[::2]) or 0 == sum(seqlist[1::2]): 
                     seqlist = [k for k in seqlist if k != 0]
                     seqstr = SeqToString(seqlist, 160, 36, ",", 3, True)
                     if info:
-                        print("Searching without zeros:", seqstr)
+                        say("Searching without zeros:", seqstr)
                     url = f"https://oeis.org/search?q={seqstr}&fmt=json"
                     raise ValueError('Try again')
                 if info:
-                    print("Sorry, no match found for:", seqstr)
-                return 0
+                    say("Sorry, no match found for:", seqstr)
+                return 0, False
 
             number = dl = ol = 0
             for j in range(min(maxnum, len(jdata))):
@@ -266,27 +273,61 @@ def QueryOEIS(
                 sl = data.count(",", 0, start)              # type: ignore
                 dl = data.count(",", start, start + length) # type: ignore
                 if dl < 12:
-                    print(f"\n*** WARNING! Only {dl} out of {ol} terms match! ***\n")
+                    say(f"\n*** WARNING! Only {dl} out of {ol} terms match! ***\n")
                 if info or dl < 12:
-                    print("You searched:", seqstr)
-                    print("OEIS-data is:", data)          # type: ignore
+                    say("You searched:", seqstr)
+                    say("OEIS-data is:", data)          # type: ignore
                     # print(f"Info: Starting at index {sl} the next {dl} 
                     # consecutive terms match.\nThe matched substring starts 
                     # at byte {start} and has length {length}.")
-                    print("*** Found:", anumber, name)
+                    say("*** Found:", anumber, name)
                 if dl > 12:
                     break
 
-            return int(number)  
+            return int(number), dl >= 12  
 
         except ValueError: 
             continue
         except requests.exceptions.RequestException as e:
-            print(f"Error: {e}")
+            say(f"Error: {e}")
 
     #raise Exception(f"Could not open {url}.")
-    print(f"Exception! Could not open {url}.")
-    return -999999
+    say(f"Exception! Could not open {url}.")
+    return -999999, False
+
+
+def QueryOEIS(
+        seqlist: list[int], 
+        maxnum: int = 1,
+        info: bool = False, 
+        minlen: int = 24 
+    ) -> int:
+    """
+    Query if a given sequence is present in the OEIS. At least 24 terms 
+    of the sequence must be given. The first three terms and signs are disregard. 
+    Sequences with huge terms might have to few terms to give reliable results. 
+    This is a heuristic function, understand it's limited reach.
+
+    Args:
+        seqlist: The sequence to search. Must have at least 24 terms.
+
+        maxnum: max number of sequences to be returned. Defaults to 1.
+
+        info: Prints details, otherwise is quiet except for warnings. Defaults to False.
+        
+        minlen: At least {minlen} terms are required.
+
+    Returns:
+        Returns anum is the A-number of the sequence, 
+        Returns 0 if the sequence was not found.
+        If sl < 5 and dl > 12, then anum probably matches the sequence,
+        modulo a couple of first terms and the signs.
+
+    Raises:
+        Exception: If the OEIS server cannot be reached after multiple attempts.
+        Currently, the function will return -999999 if the OEIS server cannot be reached.
+    """
+    return SearchOEIS(seqlist, maxnum, info, minlen)[0]
 
 
 def LookUp(t: Table, tr: Trait, info: bool = True) -> int:
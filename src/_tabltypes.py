@@ -52,6 +52,8 @@ Classes:
 
 Type Aliases:
     trow:  Type alias for a list of integers representing the row of a triangle.
+           The entries are Python ints of unbounded size, therefore rows are
+           kept as lists and not packed into fixed-width arrays like array('q').
     tabl:  Type alias for a list of rows representing a triangle.
     seq:   Type alias for a callable that takes an integer and returns an integer.
     rowgen:  Type alias for a callable that takes an integer and returns a row of a triangle.
@@ -72,7 +74,6 @@ from typing import Callable, TypeAlias, Iterator
 from itertools import accumulate, islice
 from functools import cache
 import operator
-from more_itertools import difference
 from _tablinverse import InvertMatrix
 
 # #@
@@ -324,7 +325,9 @@ class Table:
             >>> Abel.alt(4)
             [0, -64, 48, -12, 1]
         """
-        return [(-1) ** k * term for k, term in enumerate(self.row(n))]
+        row = self.row(n).copy()
+        row[1::2] = [-term for term in row[1::2]]
+        return row
 
 
     def acc(self, n: int) -> trow:
@@ -356,7 +359,8 @@ class Table:
             >>> list(accumulate(Abel.diff(5))) == Abel.row(5)
             True
         """
-        return list(difference(self.row(n)))
+        row = self.row(n)
+        return row[:1] + list(map(operator.sub, row[1:], row))
 
 
     def der(self, n: int) -> trow:
@@ -646,7 +650,8 @@ class Table:
             >>> Abel.invtrans(lambda n*n: n, 6)
             [0, 1, 2, -6, 36, -320]
         """
-        return [sum((-1)**(n-k) * self.row(n)[k] * s(k) for k in range(n + 1))
+        return [sum((-t if (n - k) & 1 else t) * s(k)
+                    for k, t in enumerate(self.row(n)))
                for n in range(size)]
 
 